@@ -23,11 +23,17 @@
 
 """EZPlugins decorators."""
 
+import sys
 from collections.abc import Callable
 from typing import TypeVar
 
 EZPT = TypeVar("EZPT")
 
+# Names of the attributes used to mark plugin classes and methods, interned as they're looked up during plugin load
+_IS_EZPLUGIN_ATTR = sys.intern("_is_ezplugin")
+_ALIAS_ATTR = sys.intern("_ezplugin_alias")
+_ORDER_ATTR = sys.intern("_ezplugin_order")
+
 __all__ = [
     "ezplugin",
     "ezplugin_metadata",
@@ -63,12 +69,9 @@ def ezplugin(cls: type[EZPT]) -> type[EZPT]:
 
     """
 
-    def decorator(cls: type[EZPT]) -> type[EZPT]:
-        # Set class attribute, we set attr to avoid errors due to protected class changes
-        setattr(cls, "_is_ezplugin", True)  # noqa: B010
-        return cls
-
-    return decorator(cls)
+    # Set class attribute, we set attr to avoid errors due to protected class changes
+    setattr(cls, _IS_EZPLUGIN_ATTR, True)
+    return cls
 
 
 def ezplugin_metadata(*, alias: str | None = None) -> Callable[[EZPT], EZPT]:
@@ -94,11 +97,11 @@ def ezplugin_metadata(*, alias: str | None = None) -> Callable[[EZPT], EZPT]:
 
     def decorator(cls: EZPT) -> EZPT:
         # Set class attribute, we set attr to avoid errors due to protected class changes
-        setattr(cls, "_is_ezplugin", True)  # noqa: B010
+        setattr(cls, _IS_EZPLUGIN_ATTR, True)
         # Setup metadata if it exists
         if alias:
             # Set class attribute, we set attr to avoid errors due to protected class changes
-            setattr(cls, "_ezplugin_alias", alias)  # noqa: B010
+            setattr(cls, _ALIAS_ATTR, alias)
         return cls
 
     return decorator
@@ -140,7 +143,7 @@ def ezplugin_method(*, order: int = 5000) -> Callable[[EZPT], EZPT]:
 
     def decorator(func: EZPT) -> EZPT:
         # Set class attribute, we set attr to avoid errors due to protected class changes
-        setattr(func, "_ezplugin_order", order)  # noqa: B010
+        setattr(func, _ORDER_ATTR, int(order))
         return func
 
     return decorator
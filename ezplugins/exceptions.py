@@ -47,8 +47,13 @@ class EZPluginMethodNotFoundError(EZPluginError):
 
     """
 
-    _plugin_name: str | None
-    _method_name: str | None
+    __slots__ = {
+        "plugin_name": "Plugin name if one is available.",
+        "method_name": "Name of the method if one is available.",
+    }
+
+    plugin_name: str | None
+    method_name: str | None
 
     def __init__(self, method_name: str | None, plugin_name: str | None):
         """
@@ -67,15 +72,5 @@ class EZPluginMethodNotFoundError(EZPluginError):
 
         super().__init__("No EZPlugin method(s) found")
 
-        self._plugin_name = plugin_name
-        self._method_name = method_name
-
-    @property
-    def plugin_name(self) -> str | None:
-        """Plugin name if one is available."""
-        return self._plugin_name
-
-    @property
-    def method_name(self) -> str | None:
-        """Name of the method if one is available."""
-        return self._method_name
+        self.plugin_name = plugin_name
+        self.method_name = method_name
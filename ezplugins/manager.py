@@ -23,11 +23,12 @@
 
 """EZPlugins manager."""
 
+import itertools
 import logging
 import pkgutil
 import re
 import sys
-from collections.abc import Generator, Iterator
+from collections.abc import Generator, Iterable, Iterator
 
 from .exceptions import EZPluginMethodNotFoundError
 from .plugin import EZPlugin
@@ -79,6 +80,12 @@ class EZPluginManager:
     """
 
     _modules: list[EZPluginModule]
+    _visited: set[str]
+    _plugin_classes: set[type]
+    _plugins_cache: list[EZPlugin] | None
+    _by_plugin_key: dict[str, list[EZPlugin]]
+    _by_method_name: dict[str, list[tuple[EZPluginMethod, EZPlugin]]]
+    _sorted_entries: list[tuple[EZPluginMethod, EZPlugin]]
 
     def __init__(self) -> None:
         """
@@ -94,6 +101,17 @@ class EZPluginManager:
 
         # Initialize the module list we loaded plugins from
         self._modules = []
+        # Names of the modules we've already searched for plugins
+        self._visited = set()
+        # Plugin classes we've already loaded, so classes imported by other modules are only loaded once
+        self._plugin_classes = set()
+        # Flattened list of plugins, built on first use and invalidated when modules are added
+        self._plugins_cache = None
+        # Indexes of plugins by fqn, name and alias, and of methods by method name
+        self._by_plugin_key = {}
+        self._by_method_name = {}
+        # All methods, sorted in order of execution
+        self._sorted_entries = []
 
     def methods(
         self,
@@ -149,24 +167,22 @@ class EZPluginManager:
 
         """
 
-        # Work out the plugins and methods we're going to call
-        # Methods are unique, we'll be calling in order of method.order
-        found_methods: dict[EZPluginMethod, EZPlugin] = {}
+        # Work out the methods we're going to call, these are kept sorted in order of method.order
+        entries = self._sorted_entries if where_name is None else self._by_method_name.get(where_name, [])
 
-        # Loop with our plugins matching the provided plugin_name or None
-        for plugin in [x for x in self.plugins if from_plugin in [None, x.fqn, x.name, x.alias]]:
-            # Loop with methods matching the method name
-            for method in [x for x in plugin.methods if where_name in [None, x.name]]:
-                # Check if plugin is in our call queue
-                found_methods[method] = plugin
+        # Limit the methods to those belonging to the plugins matching the provided plugin name
+        if from_plugin is None:
+            found_methods = entries
+        else:
+            plugin_set = set(self._by_plugin_key.get(from_plugin, []))
+            found_methods = [x for x in entries if x[1] in plugin_set]
 
         # If we didn't find any methods, raise an exception
         if not found_methods:
             raise EZPluginMethodNotFoundError(method_name=where_name, plugin_name=from_plugin)
 
         # Loop with the ordered methods
-        for method, plugin in sorted(found_methods.items(), key=lambda x: x[0].order):
-            yield (method, plugin)
+        yield from found_methods
 
     def get_plugin(self, plugin_name: str) -> set[EZPlugin]:
         """
@@ -186,17 +202,9 @@ class EZPluginManager:
 
         """
 
-        plugin_set = set()
-
-        # Loop with our plugins
-        for plugin in self.plugins:
-            # Add plugins which match the specified name
-            if plugin_name in (plugin.fqn, plugin.name, plugin.alias):
-                plugin_set.add(plugin)
-
-        return plugin_set
+        return set(self._by_plugin_key.get(plugin_name, []))
 
-    def load_package(self, package_name: str, ignore_errors: bool = False) -> None:  # pylint: disable=too-many-branches,too-complex
+    def load_package(self, package_name: str, ignore_errors: bool = False) -> None:
         """
         Recursively search the package package_name and retrieve all plugins.
 
@@ -221,57 +229,36 @@ class EZPluginManager:
             Package to load plugins from.
 
         ignore_errors : :class:`bool`
-            Ignore errors in modules that we try to load.
+            Ignore errors in modules that we try to load. Sub-packages that fail to load are not searched.
+
+        Plugin classes imported from another module within the package, such as by a package ``__init__``, are loaded from the
+        module that defines them.
 
         """
 
         logging.debug("EZPLUGINS => Finding plugins in package '%s'", package_name)
 
-        if ignore_errors:
-            try:
-                package = EZPluginModule(package_name)
-            except Exception as exc:  # pylint: disable=W0703
-                logging.debug("EZPLUGINS =>   - Failed loading package '%s': Exception, %s", package_name, exc)
-                return
-        else:
-            package = EZPluginModule(package_name)
+        # Regex matching the package and all the modules within it
+        matching = re.escape(package_name) + r"($|\.)"
 
-        # Add base package module, but only if it has plugins
-        if package.plugins:
-            self._modules.append(package)
+        # Load the base package, if it failed to load there is nothing more to search
+        if not self._load_plugin_module(package_name, ignore_errors=ignore_errors, matching=matching):
+            return
+        package_module = sys.modules[package_name]
 
-        # Grab some things we'll need below
-        base_package_path = package.module.__path__
-        base_package_name = package.module.__name__
+        # Prefixes of the sub-packages that failed to load, their modules are not searched
+        failed_prefixes: tuple[str, ...] = ()
 
-        # Iterate through the modules
-        for _, module_name, ispkg in pkgutil.iter_modules(base_package_path, base_package_name + "."):
-            # If this is a sub-package, we need to process it later
-            if ispkg:
-                self.load_package(module_name, ignore_errors=ignore_errors)
+        # Iterate through all the modules and sub-packages within the package
+        # An empty regex matches all module names
+        for _, module_name, ispkg in self._walk_packages("", package_module.__path__, package_module.__name__ + "."):
+            if failed_prefixes and module_name.startswith(failed_prefixes):
+                logging.debug("EZPLUGINS =>   - Ignoring plugin module '%s': Package failed to load", module_name)
                 continue
-            # Grab plugin module
-            if ignore_errors:
-                try:
-                    plugin_module = EZPluginModule(module_name)
-                except Exception as exc:  # pylint: disable=W0703
-                    logging.debug("EZPLUGINS =>   - Failed loading plugin module '%s': Exception, %s", module_name, exc)
-                    continue
-            else:
-                plugin_module = EZPluginModule(module_name)
-            # If we loaded OK and don't have plugins, don't add to the plugin modules list
-            if not plugin_module.plugins:
-                logging.debug("EZPLUGINS =>   - Ignoring plugin module '%s': No plugins", plugin_module.module_name)
-                continue
-            # Add to the plugin modules list
-            logging.debug(
-                "EZPLUGINS =>   - Adding plugin module: %s (%s plugins)",
-                plugin_module.module_name,
-                len(plugin_module.plugins),
-            )
-            self._modules.append(plugin_module)
+            if not self._load_plugin_module(module_name, ignore_errors=ignore_errors, matching=matching) and ispkg:
+                failed_prefixes += (module_name + ".",)
 
-    def load_module(self, module_name: str) -> None:  # pylint: disable=too-many-branches
+    def load_module(self, module_name: str) -> None:
         """
         Load plugins from a module.
 
@@ -291,25 +278,15 @@ class EZPluginManager:
         module_name : :class:`str`
             Module to load plugins from.
 
+        Plugin classes imported from another module are loaded from this module, unless they were already loaded.
+
         """
 
         logging.debug("EZPLUGINS => Finding plugins in module '%s'", module_name)
 
-        # Grab plugin module
-        plugin_module = EZPluginModule(module_name)
-        # If we loaded OK and don't have plugins, don't add to the plugin modules list
-        if not plugin_module.plugins:
-            logging.debug("EZPLUGINS =>   - Ignoring plugin module '%s': No plugins", plugin_module.module_name)
-            return
-        # Add to the plugin modules list
-        logging.debug(
-            "EZPLUGINS =>   - Adding plugin module: %s (%s plugins)",
-            plugin_module.module_name,
-            len(plugin_module.plugins),
-        )
-        self._modules.append(plugin_module)
+        self._load_plugin_module(module_name)
 
-    def load_modules(self, matching: str, ignore_errors: bool = False) -> None:  # pylint: disable=too-many-branches
+    def load_modules(self, matching: str, ignore_errors: bool = False) -> None:
         r"""
         Load plugins from modules matching a regex.
 
@@ -335,43 +312,135 @@ class EZPluginManager:
         ignore_errors : :class:`bool`
             Ignore errors in modules that we try to load.
 
+        Plugin classes imported from another module matching the regex are loaded from the module that defines them.
+
         """
 
         logging.debug("EZPLUGINS => Finding plugins in modules matching '%s'", matching)
 
         for _, module_name, _ in self._walk_packages(matching):
-            # Grab plugin module
-            if ignore_errors:
-                try:
-                    plugin_module = EZPluginModule(module_name)
-                except Exception as exc:  # pylint: disable=W0703
-                    logging.debug("EZPLUGINS =>   - Failed loading plugin module '%s': Exception, %s", module_name, exc)
-                    continue
-            else:
+            self._load_plugin_module(module_name, ignore_errors=ignore_errors, matching=matching)
+
+    def _load_plugin_module(self, module_name: str, ignore_errors: bool = False, matching: str | None = None) -> bool:
+        """
+        Load plugins from a module and add it to the modules list if it has plugins.
+
+        Modules that were already searched for plugins are skipped, as are plugins whose class was already loaded from another
+        module, or whose class is defined in another module matching the regex being loaded.
+
+        Parameters
+        ----------
+        module_name : :class:`str`
+            Module to load plugins from.
+
+        ignore_errors : :class:`bool`
+            Ignore errors in the module we try to load.
+
+        matching : :class:`str` | None
+            Regular expression matching the modules being loaded, plugin classes defined in these modules are only loaded from the
+            module that defines them.
+
+        Returns
+        -------
+        :class:`bool` :
+            False if the module failed to load and errors were ignored, True otherwise.
+
+        """
+
+        # Skip modules we've already searched
+        if module_name in self._visited:
+            logging.debug("EZPLUGINS =>   - Ignoring plugin module '%s': Already loaded", module_name)
+            return True
+        # Grab plugin module
+        if ignore_errors:
+            try:
                 plugin_module = EZPluginModule(module_name)
-            # If we loaded OK and don't have plugins, don't add to the plugin modules list
-            if not plugin_module.plugins:
-                logging.debug("EZPLUGINS =>   - Ignoring plugin module '%s': No plugins", plugin_module.module_name)
+            except Exception as exc:  # pylint: disable=W0703
+                logging.debug("EZPLUGINS =>   - Failed loading plugin module '%s': Exception, %s", module_name, exc)
+                return False
+        else:
+            plugin_module = EZPluginModule(module_name)
+        self._visited.add(module_name)
+        # Drop plugins whose class was already loaded, such as plugin classes imported from another module
+        plugins = []
+        for plugin in plugin_module.plugins:
+            plugin_class = type(plugin.obj)
+            if plugin_class in self._plugin_classes:
+                logging.debug("EZPLUGINS =>   - Ignoring plugin '%s' in '%s': Already loaded", plugin.fqn, module_name)
+                continue
+            # Plugin classes defined in another module being loaded are loaded from that module instead
+            if matching is not None and plugin.path != module_name and re.match(matching, plugin.path):
+                logging.debug(
+                    "EZPLUGINS =>   - Ignoring plugin '%s' in '%s': Loaded from '%s'",
+                    plugin.fqn,
+                    module_name,
+                    plugin.path,
+                )
                 continue
-            # Add to the plugin modules list
-            logging.debug(
-                "EZPLUGINS =>   - Adding plugin module: %s (%s plugins)",
-                plugin_module.module_name,
-                len(plugin_module.plugins),
+            self._plugin_classes.add(plugin_class)
+            plugins.append(plugin)
+        plugin_module.plugins = plugins
+        # If we loaded OK and don't have plugins, don't add to the plugin modules list
+        if not plugin_module.plugins:
+            logging.debug("EZPLUGINS =>   - Ignoring plugin module '%s': No plugins", plugin_module.module_name)
+            return True
+        # Add to the plugin modules list
+        self._add_module(plugin_module)
+        return True
+
+    def _add_module(self, plugin_module: EZPluginModule) -> None:
+        """
+        Add a plugin module to the modules list.
+
+        Parameters
+        ----------
+        plugin_module : :class:`~ezplugins.plugin_module.EZPluginModule`
+            Plugin module to add.
+
+        """
+
+        logging.debug(
+            "EZPLUGINS =>   - Adding plugin module: %s (%s plugins)",
+            plugin_module.module_name,
+            len(plugin_module.plugins),
+        )
+        self._modules.append(plugin_module)
+        # Invalidate the plugin list so it is rebuilt on next use
+        self._plugins_cache = None
+
+        # Index the plugins by their names and their methods by method name
+        new_entries: list[tuple[EZPluginMethod, EZPlugin]] = []
+        new_methods: dict[str, list[tuple[EZPluginMethod, EZPlugin]]] = {}
+        for plugin in plugin_module.plugins:
+            for plugin_key in (plugin.fqn, plugin.name, plugin.alias):
+                if plugin_key is not None:
+                    self._by_plugin_key.setdefault(plugin_key, []).append(plugin)
+            for method in plugin.methods:
+                new_entries.append((method, plugin))
+                new_methods.setdefault(method.name, []).append((method, plugin))
+
+        # Keep the method lists in order of execution, the sort is stable so methods with the same order keep their load order.
+        # The lists are replaced rather than changed in place, so they can be handed out by methods() without being copied.
+        self._sorted_entries = sorted(itertools.chain(self._sorted_entries, new_entries), key=lambda x: x[0].order)
+        for method_name, entries in new_methods.items():
+            self._by_method_name[method_name] = sorted(
+                itertools.chain(self._by_method_name.get(method_name, []), entries), key=lambda x: x[0].order
             )
-            self._modules.append(plugin_module)
 
-    def _walk_packages(self, matching: str, path: list[str] | None = None, prefix: str = "") -> Generator[pkgutil.ModuleInfo]:
+    def _walk_packages(self, matching: str, path: Iterable[str] | None = None, prefix: str = "") -> Generator[pkgutil.ModuleInfo]:
         """
         Yield ModuleInfo for all modules recursively on path. If path is None, all accessible modules.
 
+        Packages are not imported here, the consumer is expected to import each package yielded. Packages that are not imported
+        by the time the next module is requested are not searched.
+
         Parameters
         ----------
         matching : :class:`str`
             Path to match.
 
-        path : :class:`list` [ :class:`str` ] | None
-            Should be either None or a list of paths to look for modules in.
+        path : :class:`Iterable` [ :class:`str` ] | None
+            Should be either None or an iterable of paths to look for modules in.
 
         prefix : :class:`str` | None
             A string to output on the front of every module name.
@@ -398,13 +467,13 @@ class EZPluginManager:
 
             # If it is a package, dig deeper
             if info.ispkg:
-                try:
-                    __import__(info.name)
-                except Exception as exc:  # pylint: disable=broad-except
-                    logging.debug("EZPLUGINS =>   - Ignoring plugin module '%s': Exception, %s", info.name, exc)
+                # Only packages the consumer managed to import are searched, so failed packages are not imported a second time
+                package_module = sys.modules.get(info.name)
+                if package_module is None:
+                    logging.debug("EZPLUGINS =>   - Ignoring plugin module '%s': Not loaded", info.name)
                     continue
 
-                path = getattr(sys.modules[info.name], "__path__", None) or []
+                path = getattr(package_module, "__path__", None) or []
 
                 # don't traverse path items we've seen before
                 paths = [x for x in path if not _seen(x, seen_paths)]
@@ -441,9 +510,8 @@ class EZPluginManager:
 
         """
 
-        plugins = []
-        for module in self.modules:
-            # Add plugins to our list
-            plugins.extend(module.plugins)
+        # Build the plugin list if we don't have it cached
+        if self._plugins_cache is None:
+            self._plugins_cache = list(itertools.chain.from_iterable(x.plugins for x in self._modules))
 
-        return plugins
+        return self._plugins_cache
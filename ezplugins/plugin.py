@@ -23,12 +23,93 @@
 
 """EZPlugins plugin classes."""
 
+import operator
+import sys
+import weakref
+from types import FunctionType
+
+from .decorators import _ALIAS_ATTR, _ORDER_ATTR
 from .plugin_method import EZPluginMethod
 
 __all__ = [
     "EZPlugin",
 ]
 
+# Sort key used to order plugin methods by their execution order
+_ORDER_KEY = operator.attrgetter("order")
+# Plugin method names found in each plugin class, so classes instantiated more than once are only searched once
+_METHOD_NAMES_CACHE: weakref.WeakKeyDictionary[type, tuple[str, ...]] = weakref.WeakKeyDictionary()
+
+
+def _plugin_method_names(plugin_class: type) -> tuple[str, ...]:
+    """
+    Return the names of the methods in a plugin class that were decorated as plugin methods.
+
+    Results are cached per plugin class.
+
+    Parameters
+    ----------
+    plugin_class : :class:`type`
+        Plugin class.
+
+    Returns
+    -------
+    :class:`tuple` [ :class:`str`, ... ] :
+        Plugin method names, in name order.
+
+    """
+
+    # Check if we already searched this class
+    method_names = _METHOD_NAMES_CACHE.get(plugin_class)
+    if method_names is None:
+        method_names = _find_plugin_method_names(plugin_class)
+        _METHOD_NAMES_CACHE[plugin_class] = method_names
+
+    return method_names
+
+
+def _find_plugin_method_names(plugin_class: type) -> tuple[str, ...]:
+    """
+    Search a plugin class for methods that were decorated as plugin methods.
+
+    Parameters
+    ----------
+    plugin_class : :class:`type`
+        Plugin class.
+
+    Returns
+    -------
+    :class:`tuple` [ :class:`str`, ... ] :
+        Plugin method names, in name order.
+
+    """
+
+    # Loop through the class hierarchy, we use the class dicts directly to avoid triggering descriptors such as properties
+    method_names: list[str] = []
+    seen_names: set[str] = set()
+    # Bind the globals and methods used in the loop below to locals, these are looked up for every attribute we check
+    _callable, _getattr, _isinstance = callable, getattr, isinstance
+    function_type, order_attr = FunctionType, _ORDER_ATTR
+    method_names_append, seen_names_add = method_names.append, seen_names.add
+    for klass in plugin_class.__mro__[:-1]:
+        for attr_name, attr in vars(klass).items():
+            # Only the first definition found in the hierarchy counts, the rest are overridden
+            if attr_name in seen_names:
+                continue
+            seen_names_add(attr_name)
+            # Plain functions carry the order in their dict, so we can check it without the cost of a failed attribute lookup
+            if _isinstance(attr, function_type):
+                order = attr.__dict__.get(order_attr)
+            else:
+                # Unwrap class and static methods
+                func = _getattr(attr, "__func__", attr)
+                order = _getattr(func, order_attr, None) if _callable(func) else None
+            # Check if it has an order, if so its a method we want
+            if order is not None:
+                method_names_append(attr_name)
+
+    return tuple(sorted(method_names))
+
 
 class EZPlugin:
     """
@@ -43,8 +124,10 @@ class EZPlugin:
 
     """
 
+    __slots__ = ("_obj", "_methods", "_name", "_path", "_fqn", "_alias")
+
     _obj: object
-    _methods: list[EZPluginMethod]
+    _methods: tuple[EZPluginMethod, ...]
     _name: str
     _path: str
     _fqn: str
@@ -63,20 +146,42 @@ class EZPlugin:
 
         """
 
+        plugin_class = type(obj)
+        # Names are interned as they're used as lookup keys when matching plugins, and are shared by repeat loads of a class
+        name = sys.intern("#" + plugin_class.__name__)
+        path = sys.intern(plugin_class.__module__)
+
         self._obj = obj
-        self._methods = []
-        self._name = f"#{self.obj.__class__.__name__}"
-        self._path = f"{self.obj.__class__.__module__}"
-        self._fqn = f"{self.path}{self.name}"
-        self._alias = getattr(self.obj, "_ezplugin_alias", None)
-
-        # Loop through all items in the object
-        for attr_name in dir(self.obj):
-            # Grab the item we found
-            attr = getattr(self.obj, attr_name)
-            # Check if its callable and it has an order, if so its a method we want
-            if callable(attr) and getattr(attr, "_ezplugin_order", None):
-                self._methods.append(EZPluginMethod(attr))
+        self._name = name
+        self._path = path
+        self._fqn = sys.intern(path + name)
+        # The alias is set on the class by the decorator, so we look it up in the class dicts rather than on the object
+        alias = None
+        for klass in plugin_class.__mro__:
+            if _ALIAS_ATTR in klass.__dict__:
+                alias = klass.__dict__[_ALIAS_ATTR]
+                break
+        # Only exact strings can be interned, str subclasses such as enum.StrEnum members are kept as they are
+        self._alias = sys.intern(alias) if type(alias) is str else alias  # pylint: disable=unidiomatic-typecheck
+
+        method_names = _plugin_method_names(plugin_class)
+        # Decorated callables can also be assigned to the plugin object itself, these are not in the class dicts
+        obj_dict = getattr(obj, "__dict__", {})
+        obj_method_names = [k for k, v in obj_dict.items() if callable(v) and getattr(v, _ORDER_ATTR, None) is not None]
+        if obj_method_names:
+            method_names = tuple(sorted(set(method_names).union(obj_method_names)))
+
+        # Add the methods bound to the plugin object in name order
+        methods = []
+        for attr_name in method_names:
+            attr = getattr(obj, attr_name)
+            # The plugin object may have replaced a method, for instance with None to disable it
+            if callable(attr) and getattr(attr, _ORDER_ATTR, None) is not None:
+                methods.append(EZPluginMethod(attr))
+        # Sort the methods in order of execution, the sort is stable so methods with the same order stay in name order
+        methods.sort(key=_ORDER_KEY)
+        # Methods don't change after load
+        self._methods = tuple(methods)
 
     #
     # Properties
@@ -96,14 +201,14 @@ class EZPlugin:
         return self._obj
 
     @property
-    def methods(self) -> list[EZPluginMethod]:
+    def methods(self) -> tuple[EZPluginMethod, ...]:
         """
-        Methods that were designated as callable within an EZPlugin.
+        Methods that were designated as callable within an EZPlugin, in order of execution.
 
         Returns
         -------
-        :class:`list` [ :class:`~plugin_method.EZPluginMethod` ] :
-            A list of callables.
+        :class:`tuple` [ :class:`~plugin_method.EZPluginMethod`, ... ] :
+            A tuple of callables.
 
         """
         return self._methods
@@ -26,12 +26,14 @@
 from collections.abc import Callable
 from typing import Any
 
+from .decorators import _ORDER_ATTR
+
 __all__ = [
     "EZPluginMethod",
 ]
 
 
-class EZPluginMethod:
+class EZPluginMethod:  # pylint: disable=too-few-public-methods
     """
     Representation of a plugin method. This class is designed to be instantiated during plugin load.
 
@@ -44,7 +46,15 @@ class EZPluginMethod:
 
     """
 
-    _method: Callable[..., Any]
+    __slots__ = {
+        "method": "Actual :class:`EZPlugin` method which can be called.",
+        "name": "Name of the EZPlugin method.",
+        "order": "Order of execution of this EZPlugin method.",
+    }
+
+    method: Callable[..., Any]
+    name: str
+    order: int
 
     def __init__(self, method: Callable[..., Any]) -> None:
         """
@@ -59,7 +69,9 @@ class EZPluginMethod:
 
         """
 
-        self._method = method
+        self.method = method
+        self.name = method.__name__
+        self.order = getattr(method, _ORDER_ATTR)
 
     def run(self, *args: Any, **kwargs: Any) -> Any:
         """
@@ -75,42 +87,3 @@ class EZPluginMethod:
 
         """
         return self.method(*args, **kwargs)
-
-    @property
-    def method(self) -> Callable[..., Any]:
-        """
-        Actual :class:`EZPlugin` method which can be called.
-
-        Returns
-        -------
-        :class:`Callable` [ ..., Any ] :
-            A callable.
-
-        """
-        return self._method
-
-    @property
-    def name(self) -> str:
-        """
-        Name of the EZPlugin method.
-
-        Returns
-        -------
-        :class:`str` :
-            :class:`EZPlugin` method name.
-
-        """
-        return self.method.__name__
-
-    @property
-    def order(self) -> int:
-        """
-        Order of execution of this EZPlugin method.
-
-        Returns
-        -------
-        :class:`int` :
-            Order of execution.
-
-        """
-        return int(getattr(self.method, "_ezplugin_order"))  # noqa: B009
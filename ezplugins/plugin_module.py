@@ -24,11 +24,11 @@
 """EZPlugins module class."""
 
 import importlib
-import inspect
 import logging
 import sys
 from types import ModuleType
 
+from .decorators import _IS_EZPLUGIN_ATTR
 from .plugin import EZPlugin
 
 __all__ = [
@@ -36,7 +36,7 @@ __all__ = [
 ]
 
 
-class EZPluginModule:
+class EZPluginModule:  # pylint: disable=too-few-public-methods
     """
     Representation of a module within the plugin package hierarchy, which may contain plugins.
 
@@ -51,9 +51,15 @@ class EZPluginModule:
 
     """
 
-    _module: ModuleType
-    _module_name: str
-    _plugins: list[EZPlugin]
+    __slots__ = {
+        "module": "Imported module.",
+        "module_name": "Name of the module.",
+        "plugins": "List of instantiated :class:`~ezplugins.plugin.EZPlugin` plugins that belong to this module.",
+    }
+
+    module: ModuleType
+    module_name: str
+    plugins: list[EZPlugin]
 
     def __init__(self, module_name: str):
         """
@@ -74,64 +80,27 @@ class EZPluginModule:
         """
 
         # Start off with the module being None and an empty plugin list
-        self._module_name = module_name
-        self._plugins = []
+        self.module_name = module_name
+        self.plugins = []
 
         logging.debug("EZPLUGINS =>   - Loading module: %s", module_name)
 
         # Check if module is loaded and import if it's not
-        module = sys.modules.get(module_name, importlib.import_module(module_name))
+        module = sys.modules.get(module_name)
+        if module is None:
+            module = importlib.import_module(module_name)
 
-        self._module = module
+        self.module = module
 
-        # Loop with class names
-        for _, plugin_class in inspect.getmembers(self._module, inspect.isclass):
+        # Loop with the module attributes in name order, we use the module dict directly to avoid triggering attribute lookups
+        for _, plugin_class in sorted(vars(module).items()):
             # Only add classes that were marked as EZPlugins
-            if not getattr(plugin_class, "_is_ezplugin", False):
+            if not isinstance(plugin_class, type) or not getattr(plugin_class, _IS_EZPLUGIN_ATTR, False):
                 continue
             # Save plugin
-            self._plugins.append(EZPlugin(plugin_class()))
+            self.plugins.append(EZPlugin(plugin_class()))
             logging.debug(
                 "EZPLUGINS =>   - Loaded from '%s', class '%s'",
                 self.module_name,
                 plugin_class.__name__,
             )
-
-    @property
-    def module(self) -> ModuleType:
-        """
-        Property containing the imported module.
-
-        Returns
-        -------
-        :class:`ModuleType` :
-            Module that was imported (if it was imported, or None).
-
-        """
-        return self._module
-
-    @property
-    def module_name(self) -> str:
-        """
-        Property containing the name of the module.
-
-        Returns
-        -------
-        :class:`str` :
-            Module name.
-
-        """
-        return self._module_name
-
-    @property
-    def plugins(self) -> list[EZPlugin]:
-        """
-        Property containing a list of EZPlugin's that belong to this module.
-
-        Returns
-        -------
-        :class:`list` [ :class:`ezplugins.plugin.EZPlugin` ] :
-            List of instantiated EZPlugin's that represent the plugin objects that were instantiated.
-
-        """
-        return self._plugins
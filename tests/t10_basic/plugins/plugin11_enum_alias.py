@@ -0,0 +1,49 @@
+#
+# SPDX-License-Identifier: MIT
+#
+# Copyright (C) 2019-2024, AllWorldIT.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies
+# of the Software, and to permit persons to whom the Software is furnished to do
+# so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""EZPlugins tests - Plugins for tests."""
+
+import enum
+
+import ezplugins
+
+__all__ = [
+    "Group",
+    "Plugin11",
+]
+
+
+class Group(str, enum.Enum):
+    """Test plugin groups."""
+
+    AUTH = "auth"
+
+
+@ezplugins.ezplugin_metadata(alias=Group.AUTH)
+class Plugin11:  # pylint: disable=too-few-public-methods
+    """Test plugin 11 with an enum alias."""
+
+    @ezplugins.ezplugin_method()
+    def test_func1(self) -> str:
+        """Test function."""
+        return f"{self.__module__}.{__name__}#{self.__class__.__name__}"
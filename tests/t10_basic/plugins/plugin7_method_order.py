@@ -40,6 +40,11 @@ class Plugin7a:  # pylint: disable=too-few-public-methods
         """Test function."""
         return f"{self.__module__}.{__name__}#{self.__class__.__name__}"
 
+    @ezplugins.ezplugin_method(order=0)
+    def test_func2(self) -> str:
+        """Test function with a zero order."""
+        return f"{self.__module__}.{__name__}#{self.__class__.__name__}"
+
 
 @ezplugins.ezplugin
 class Plugin7b:  # pylint: disable=too-few-public-methods
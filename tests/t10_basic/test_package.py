@@ -44,6 +44,9 @@ class TestPackageBasicFunctionality(BaseTest):
 
         expected_modules = [
             "tests.t10_basic.plugins.plugin1",
+            "tests.t10_basic.plugins.plugin10_inheritance",
+            "tests.t10_basic.plugins.plugin11_enum_alias",
+            "tests.t10_basic.plugins.plugin12_instance_methods",
             "tests.t10_basic.plugins.plugin2",
             "tests.t10_basic.plugins.plugin3_plus_4",
             "tests.t10_basic.plugins.plugin5_alias",
@@ -54,6 +57,7 @@ class TestPackageBasicFunctionality(BaseTest):
             "tests.t10_basic.plugins.plugin8_call_parameters",
             "tests.t10_basic.plugins.subplugin.subplugin1",
             "tests.t10_basic.plugins.subplugin_init",
+            "tests.t10_basic.plugins.subplugin_reexport.subplugin1",
             "tests.t10_basic.plugins.subsubplugin.thesubsubplugin.subsubplugin1",
         ]
 
@@ -61,6 +65,43 @@ class TestPackageBasicFunctionality(BaseTest):
 
         assert received_modules == expected_modules, "All plugins did not get loaded"
 
+        # Loading the package again should not load any modules twice
+        self.data["plugins"].load_package(self.plugin_path("plugins"))
+        self.data["plugins"].load_package(self.plugin_path("plugins.subplugin"))
+
+        received_modules = [x.module_name for x in self.data["plugins"].modules]
+
+        assert received_modules == expected_modules, "Plugins were loaded more than once"
+
+    def test_plugins(self) -> None:
+        """Test the list of loaded plugins."""
+
+        expected_plugins = [
+            "tests.t10_basic.plugins.plugin1#Plugin1",
+            "tests.t10_basic.plugins.plugin10_inheritance#Plugin10",
+            "tests.t10_basic.plugins.plugin11_enum_alias#Plugin11",
+            "tests.t10_basic.plugins.plugin12_instance_methods#Plugin12",
+            "tests.t10_basic.plugins.plugin2#Plugin2",
+            "tests.t10_basic.plugins.plugin3_plus_4#Plugin3",
+            "tests.t10_basic.plugins.plugin3_plus_4#Plugin4",
+            "tests.t10_basic.plugins.plugin5_alias#Plugin5",
+            "tests.t10_basic.plugins.plugin6a_alias#Plugin6a",
+            "tests.t10_basic.plugins.plugin6b_alias#Plugin6b",
+            "tests.t10_basic.plugins.plugin6c_no_alias#Plugin6c",
+            "tests.t10_basic.plugins.plugin7_method_order#Plugin7a",
+            "tests.t10_basic.plugins.plugin7_method_order#Plugin7b",
+            "tests.t10_basic.plugins.plugin8_call_parameters#Plugin8",
+            "tests.t10_basic.plugins.subplugin.subplugin1#SubPlugin1",
+            "tests.t10_basic.plugins.subplugin_init#SubPluginInit1",
+            "tests.t10_basic.plugins.subplugin_reexport.subplugin1#SubPluginReexport1",
+            "tests.t10_basic.plugins.subsubplugin.thesubsubplugin.subsubplugin1#SubSubPlugin1",
+        ]
+
+        received_plugins = [x.fqn for x in self.data["plugins"].plugins]
+
+        assert received_plugins == expected_plugins, "We did not get the plugins we should of gotten back"
+        assert self.data["plugins"].plugins is self.data["plugins"].plugins, "Plugin list was not cached"
+
     def test_get_single_plugin_from_single_plugin_file(self) -> None:
         """Test getting a single plugin."""
 
@@ -79,6 +120,22 @@ class TestPackageBasicFunctionality(BaseTest):
 
         assert received_plugins == expected_plugins, "We did not get the plugins we should of gotten back"
 
+    def test_plugin_attributes(self) -> None:
+        """Test the attributes of a plugin with an alias."""
+
+        expected_attributes = (
+            "tests.t10_basic.plugins.plugin6a_alias#Plugin6a",
+            "tests.t10_basic.plugins.plugin6a_alias",
+            "#Plugin6a",
+            "plugin6",
+            "Plugin6a",
+        )
+
+        plugins = self.data["plugins"].get_plugin("tests.t10_basic.plugins.plugin6a_alias#Plugin6a")
+        received_attributes = [(x.fqn, x.path, x.name, x.alias, x.obj.__class__.__name__) for x in plugins]
+
+        assert received_attributes == [expected_attributes], "Plugin attributes don't match what they should"
+
     def test_call_all(self) -> None:
         """Test calling a plugin method from all plugins."""
 
@@ -93,6 +150,11 @@ class TestPackageBasicFunctionality(BaseTest):
                 "test_func1",
                 "tests.t10_basic.plugins.plugin1.tests.t10_basic.plugins.plugin1#Plugin1",
             ),
+            (
+                "tests.t10_basic.plugins.plugin11_enum_alias#Plugin11",
+                "test_func1",
+                "tests.t10_basic.plugins.plugin11_enum_alias.tests.t10_basic.plugins.plugin11_enum_alias#Plugin11",
+            ),
             (
                 "tests.t10_basic.plugins.plugin2#Plugin2",
                 "test_func1",
@@ -138,6 +200,12 @@ class TestPackageBasicFunctionality(BaseTest):
                 "test_func1",
                 "tests.t10_basic.plugins.subplugin_init.tests.t10_basic.plugins.subplugin_init#SubPluginInit1",
             ),
+            (
+                "tests.t10_basic.plugins.subplugin_reexport.subplugin1#SubPluginReexport1",
+                "test_func1",
+                "tests.t10_basic.plugins.subplugin_reexport.subplugin1.tests.t10_basic.plugins.subplugin_reexport.subplugin1"
+                "#SubPluginReexport1",
+            ),
             (
                 "tests.t10_basic.plugins.subsubplugin.thesubsubplugin.subsubplugin1#SubSubPlugin1",
                 "test_func1",
@@ -222,3 +290,128 @@ class TestPackageBasicFunctionality(BaseTest):
             received_results.append((plugin.fqn, method.name, result))
 
         assert received_results == expected_results, "Results don't match what they should"
+
+    def test_call_with_plugin_enum_alias(self) -> None:
+        """Test calling a plugin method using a plugin alias which is a str subclass."""
+
+        expected_results = [
+            (
+                "tests.t10_basic.plugins.plugin11_enum_alias#Plugin11",
+                "test_func1",
+                "tests.t10_basic.plugins.plugin11_enum_alias.tests.t10_basic.plugins.plugin11_enum_alias#Plugin11",
+            ),
+        ]
+
+        received_results = []
+        for method, plugin in self.data["plugins"].methods(where_name="test_func1", from_plugin="auth"):
+            result = method.run()
+            # Save plugin results with a name
+            received_results.append((plugin.fqn, method.name, result))
+
+        assert received_results == expected_results, "Results don't match what they should"
+
+    def test_call_all_methods_with_plugin_name(self) -> None:
+        """Test calling all plugin methods using a plugin name."""
+
+        expected_results = [
+            (
+                "tests.t10_basic.plugins.plugin3_plus_4#Plugin3",
+                "test_func1",
+                "tests.t10_basic.plugins.plugin3_plus_4.tests.t10_basic.plugins.plugin3_plus_4#Plugin3",
+            ),
+        ]
+
+        received_results = []
+        for method, plugin in self.data["plugins"].methods(from_plugin="#Plugin3"):
+            result = method.run()
+            # Save plugin results with a name
+            received_results.append((plugin.fqn, method.name, result))
+
+        assert received_results == expected_results, "Results don't match what they should"
+
+    def test_call_with_zero_order(self) -> None:
+        """Test calling a plugin method with an execution order of 0."""
+
+        expected_results = [
+            (
+                "tests.t10_basic.plugins.plugin7_method_order#Plugin7a",
+                "test_func2",
+                "tests.t10_basic.plugins.plugin7_method_order.tests.t10_basic.plugins.plugin7_method_order#Plugin7a",
+            ),
+        ]
+
+        received_results = []
+        for method, plugin in self.data["plugins"].methods(where_name="test_func2"):
+            result = method.run()
+            # Save plugin results with a name
+            received_results.append((plugin.fqn, method.name, result))
+
+        assert received_results == expected_results, "Results don't match what they should"
+
+    def test_call_inherited(self) -> None:
+        """Test calling plugin methods that are inherited and overridden."""
+
+        expected_results = [
+            (
+                "tests.t10_basic.plugins.plugin10_inheritance#Plugin10",
+                "test_func3",
+                "tests.t10_basic.plugins.plugin10_inheritance.tests.t10_basic.plugins.plugin10_inheritance#Plugin10",
+            ),
+            (
+                "tests.t10_basic.plugins.plugin10_inheritance#Plugin10",
+                "test_func4",
+                "base.tests.t10_basic.plugins.plugin10_inheritance.tests.t10_basic.plugins.plugin10_inheritance#Plugin10",
+            ),
+        ]
+
+        received_results = []
+        for method, plugin in self.data["plugins"].methods(from_plugin="#Plugin10"):
+            result = method.run()
+            # Save plugin results with a name
+            received_results.append((plugin.fqn, method.name, result))
+
+        assert received_results == expected_results, "Results don't match what they should"
+
+    def test_call_instance_methods(self) -> None:
+        """Test calling plugin methods that were replaced on the plugin object."""
+
+        expected_results = [
+            (
+                "tests.t10_basic.plugins.plugin12_instance_methods#Plugin12",
+                "test_func5",
+                "tests.t10_basic.plugins.plugin12_instance_methods.test_func5",
+            ),
+        ]
+
+        received_results = []
+        for method, plugin in self.data["plugins"].methods(from_plugin="#Plugin12"):
+            result = method.run()
+            # Save plugin results with a name
+            received_results.append((plugin.fqn, method.name, result))
+
+        assert received_results == expected_results, "Results don't match what they should"
+
+    def test_module_load_imported(self) -> None:
+        """Test loading of plugins imported from another module."""
+        plugins = ezplugins.EZPluginManager()
+        plugins.load_module(self.plugin_path("plugins.plugin9_imported"))
+
+        expected_modules = [
+            "tests.t10_basic.plugins.plugin9_imported",
+        ]
+        expected_plugins = [
+            "tests.t10_basic.plugins.plugin1#Plugin1",
+        ]
+
+        received_modules = [x.module_name for x in plugins.modules]
+        received_plugins = [x.fqn for x in plugins.plugins]
+
+        assert received_modules == expected_modules, "Imported plugins did not get loaded"
+        assert received_plugins == expected_plugins, "Imported plugins did not get loaded"
+
+        # Loading the module the plugin is defined in should not load the plugin twice
+        plugins.load_module(self.plugin_path("plugins.plugin1"))
+
+        received_modules = [x.module_name for x in plugins.modules]
+
+        assert received_modules == expected_modules, "Plugins were loaded more than once"
@@ -26,6 +26,7 @@
 import ezplugins
 
 from ..base import BaseTest
+from .plugins_ignore_errors import IMPORT_COUNTS
 
 __all__ = [
     "TestLoadExceptionsWithIgnoreErrors",
@@ -60,3 +61,24 @@ class TestLoadExceptionsWithIgnoreErrors(BaseTest):
         received_modules = [x.module_name for x in self.data["plugins"].modules]
 
         assert received_modules == expected_modules, "Plugins did not return correct load status"
+
+    def test_plugin_package_with_subpackage_exceptions(self) -> None:
+        """Test loading of plugins from a package with sub-packages that fail to load."""
+        self.data["plugins"] = ezplugins.EZPluginManager()
+
+        # Sub-package import counts are kept for the whole process, so we check how much they go up by
+        count_name = "tests.t20_exceptions.plugins_ignore_errors.subplugins_import_exception"
+        import_count = IMPORT_COUNTS.get(count_name, 0)
+
+        self.data["plugins"].load_package(self.plugin_path("plugins_ignore_errors"), ignore_errors=True)
+
+        expected_modules = [
+            "tests.t20_exceptions.plugins_ignore_errors.plugin1",
+        ]
+
+        received_modules = [x.module_name for x in self.data["plugins"].modules]
+
+        assert received_modules == expected_modules, "Plugins did not return correct load status"
+
+        # Sub-packages that fail to import should only be imported once
+        assert IMPORT_COUNTS[count_name] == import_count + 1, "Sub-package was imported more than once"
@@ -51,6 +51,32 @@ class TestLoadModuleFunctionality(BaseTest):
 
         assert received_modules == expected_modules, "All plugins did not get loaded"
 
+        # Loading the module again should not load it twice
+        self.data["plugins"].load_module("tests.t30_modules.plugins.plugin1")
+
+        received_modules = [x.module_name for x in self.data["plugins"].modules]
+
+        assert received_modules == expected_modules, "Plugins were loaded more than once"
+
+    def test_call_all_methods(self) -> None:
+        """Test calling all plugin methods."""
+
+        expected_results = [
+            (
+                "tests.t30_modules.plugins.plugin1#Plugin1",
+                "test_func1",
+                "tests.t30_modules.plugins.plugin1.tests.t30_modules.plugins.plugin1#Plugin1",
+            ),
+        ]
+
+        received_results = []
+        for method, plugin in self.data["plugins"].methods():
+            result = method.run()
+            # Save plugin results with a name
+            received_results.append((plugin.fqn, method.name, result))
+
+        assert received_results == expected_results, "Results don't match what they should"
+
     def test_load_blank_module(self) -> None:
         """Test loading of blank plugin."""
         self.data["plugins"] = ezplugins.EZPluginManager()
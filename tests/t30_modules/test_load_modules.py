@@ -53,6 +53,13 @@ class TestLoadModulesFunctionality(BaseTest):
 
         assert received_modules == expected_modules, "All plugins did not get loaded"
 
+        # Loading the modules again should not load any modules twice
+        self.data["plugins"].load_modules(r"^tests($|\.t30_modules($|\.plugins($|\.)))")
+
+        received_modules = [x.module_name for x in self.data["plugins"].modules]
+
+        assert received_modules == expected_modules, "Plugins were loaded more than once"
+
     def test_load_blank_modules(self) -> None:
         """Test loading of blank plugin."""
         self.data["plugins"] = ezplugins.EZPluginManager()